@@ -0,0 +1,22 @@
+"""
+Build backend that only supports editable installs
+
+app.py serves src/static/ from next to the module, and the static files are
+not packaged, so a regular wheel or sdist would fail on import. Those builds
+are refused here; the editable hooks are delegated to setuptools.
+"""
+
+from setuptools.build_meta import *  # noqa: F401,F403
+
+_EDITABLE_ONLY = (
+    "mergington-activities only supports editable installs; "
+    "use `pip install -e .` from the repository root"
+)
+
+
+def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
+    raise RuntimeError(_EDITABLE_ONLY)
+
+
+def build_sdist(sdist_directory, config_settings=None):
+    raise RuntimeError(_EDITABLE_ONLY)
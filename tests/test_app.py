@@ -2,62 +2,87 @@
 Tests for the Mergington High School Activities API
 """
 
-import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+import asyncio
+from types import MappingProxyType
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import httpx
+import pytest
+import pytest_asyncio
 
 from app import app, activities
 
+CHESS_SIGNUP = "/activities/Chess Club/signup"
+BASKETBALL_SIGNUP = "/activities/Basketball/signup"
+NONEXISTENT_SIGNUP = "/activities/Nonexistent Club/signup"
+
+NEW_STUDENT_EMAIL = "newstudent@mergington.edu"
+NEW_STUDENT_PARAMS = MappingProxyType({"email": NEW_STUDENT_EMAIL})
+CHESS_MEMBER_EMAIL = "michael@mergington.edu"  # Already signed up for Chess Club
+CHESS_MEMBER_PARAMS = MappingProxyType({"email": CHESS_MEMBER_EMAIL})
+UNKNOWN_STUDENT_PARAMS = MappingProxyType({"email": "student@mergington.edu"})
+NOT_SIGNED_UP_PARAMS = MappingProxyType({"email": "notexist@mergington.edu"})
+
+# Participants as loaded from the app, before any test has run
+_INITIAL_PARTICIPANTS = {
+    key: list(value["participants"])
+    for key, value in activities.items()
+}
+
+
+def _participants(name):
+    """Return the participants of an activity as a set for membership checks"""
+    return set(activities[name]["participants"])
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create an async test client bound directly to the FastAPI app"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
+async def activities_response(client):
+    """Fetch GET /activities once for the read-only tests"""
+    response = await client.get("/activities")
+    return response, response.json()
 
 
 @pytest.fixture
 def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original = {
-        key: {"participants": list(value["participants"])}
-        for key, value in activities.items()
-    }
+    """Revert activities changed by a test back to their initial state"""
     yield
-    # Restore after test
+    # Restore only the activities whose participants changed
     for key, value in activities.items():
-        value["participants"] = original[key]["participants"]
+        original = _INITIAL_PARTICIPANTS[key]
+        if value["participants"] != original:
+            value["participants"] = list(original)
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_200(self, client):
+    async def test_get_activities_returns_200(self, activities_response):
         """Test that getting activities returns 200 status"""
-        response = client.get("/activities")
+        response, _ = activities_response
         assert response.status_code == 200
     
-    def test_get_activities_returns_dict(self, client):
+    async def test_get_activities_returns_dict(self, activities_response):
         """Test that activities response is a dictionary"""
-        response = client.get("/activities")
-        assert isinstance(response.json(), dict)
+        _, activities_data = activities_response
+        assert isinstance(activities_data, dict)
     
-    def test_get_activities_contains_expected_keys(self, client):
+    async def test_get_activities_contains_expected_keys(self, activities_response):
         """Test that activities have expected keys"""
-        response = client.get("/activities")
-        activities_data = response.json()
+        _, activities_data = activities_response
         
         assert "Chess Club" in activities_data
         assert "Programming Class" in activities_data
     
-    def test_activity_has_required_fields(self, client):
+    async def test_activity_has_required_fields(self, activities_response):
         """Test that each activity has required fields"""
-        response = client.get("/activities")
-        activities_data = response.json()
+        _, activities_data = activities_response
         
         for activity_name, activity_details in activities_data.items():
             assert "description" in activity_details
@@ -65,10 +90,9 @@ class TestGetActivities:
             assert "max_participants" in activity_details
             assert "participants" in activity_details
     
-    def test_participants_is_list(self, client):
+    async def test_participants_is_list(self, activities_response):
         """Test that participants field is a list"""
-        response = client.get("/activities")
-        activities_data = response.json()
+        _, activities_data = activities_response
         
         for activity_details in activities_data.values():
             assert isinstance(activity_details["participants"], list)
@@ -77,165 +101,105 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_returns_200(self, client, reset_activities):
-        """Test that successfully signing up returns 200"""
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "newstudent@mergington.edu"}
-        )
-        assert response.status_code == 200
-    
-    def test_signup_returns_success_message(self, client, reset_activities):
-        """Test that signup returns a success message"""
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "newstudent@mergington.edu"}
-        )
-        data = response.json()
-        assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
-    
-    def test_signup_adds_participant(self, client, reset_activities):
-        """Test that signup actually adds participant to activity"""
-        email = "testuser@mergington.edu"
+    async def test_signup_full_contract(self, client, reset_activities):
+        """Test that signup returns 200, a success message, and adds the participant"""
+        email = NEW_STUDENT_EMAIL
         initial_count = len(activities["Chess Club"]["participants"])
         
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
+        response = await client.post(CHESS_SIGNUP, params=NEW_STUDENT_PARAMS)
         
         assert response.status_code == 200
+        data = response.json()
+        assert "message" in data
+        assert email in data["message"]
         assert len(activities["Chess Club"]["participants"]) == initial_count + 1
-        assert email in activities["Chess Club"]["participants"]
+        assert email in _participants("Chess Club")
     
-    def test_signup_duplicate_returns_400(self, client, reset_activities):
-        """Test that signing up twice returns 400 error"""
-        email = "michael@mergington.edu"  # Already signed up for Chess Club
-        
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
-        
-        assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
-    
-    def test_signup_nonexistent_activity_returns_404(self, client):
-        """Test that signing up for non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup",
-            params={"email": "student@mergington.edu"}
-        )
-        
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
-    
-    def test_signup_multiple_activities(self, client, reset_activities):
+    async def test_signup_multiple_activities(self, client, reset_activities):
         """Test that a student can sign up for multiple activities"""
         email = "versatile@mergington.edu"
         
-        response1 = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
-        response2 = client.post(
-            "/activities/Basketball/signup",
-            params={"email": email}
+        response1, response2 = await asyncio.gather(
+            client.post(CHESS_SIGNUP, params={"email": email}),
+            client.post(BASKETBALL_SIGNUP, params={"email": email}),
         )
         
         assert response1.status_code == 200
         assert response2.status_code == 200
-        assert email in activities["Chess Club"]["participants"]
-        assert email in activities["Basketball"]["participants"]
+        assert email in _participants("Chess Club")
+        assert email in _participants("Basketball")
 
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/signup endpoint"""
     
-    def test_delete_returns_200(self, client, reset_activities):
-        """Test that successfully unregistering returns 200"""
-        email = "michael@mergington.edu"  # Already signed up
+    async def test_delete_full_contract(self, client, reset_activities):
+        """Test that delete returns 200, a success message, and removes the participant"""
+        email = CHESS_MEMBER_EMAIL
+        initial_count = len(activities["Chess Club"]["participants"])
         
-        response = client.delete(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
+        response = await client.delete(CHESS_SIGNUP, params=CHESS_MEMBER_PARAMS)
         
         assert response.status_code == 200
-    
-    def test_delete_returns_success_message(self, client, reset_activities):
-        """Test that delete returns a success message"""
-        email = "michael@mergington.edu"
-        
-        response = client.delete(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
-        
         data = response.json()
         assert "message" in data
-        assert "michael@mergington.edu" in data["message"]
-    
-    def test_delete_removes_participant(self, client, reset_activities):
-        """Test that delete actually removes participant from activity"""
-        email = "michael@mergington.edu"
-        initial_count = len(activities["Chess Club"]["participants"])
-        
-        response = client.delete(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
-        
-        assert response.status_code == 200
+        assert email in data["message"]
         assert len(activities["Chess Club"]["participants"]) == initial_count - 1
-        assert email not in activities["Chess Club"]["participants"]
+        assert email not in _participants("Chess Club")
     
-    def test_delete_nonexistent_student_returns_400(self, client, reset_activities):
-        """Test that deleting non-existent participant returns 400"""
-        response = client.delete(
-            "/activities/Chess Club/signup",
-            params={"email": "notexist@mergington.edu"}
-        )
-        
-        assert response.status_code == 400
-        assert "not signed up" in response.json()["detail"]
-    
-    def test_delete_nonexistent_activity_returns_404(self, client):
-        """Test that deleting from non-existent activity returns 404"""
-        response = client.delete(
-            "/activities/Nonexistent Club/signup",
-            params={"email": "student@mergington.edu"}
-        )
-        
-        assert response.status_code == 404
-    
-    def test_signup_then_delete(self, client, reset_activities):
+    async def test_signup_then_delete(self, client, reset_activities):
         """Test signup followed by delete"""
         email = "flowtest@mergington.edu"
         
         # Sign up
-        signup_response = client.post(
-            "/activities/Chess Club/signup",
+        signup_response = await client.post(
+            CHESS_SIGNUP,
             params={"email": email}
         )
         assert signup_response.status_code == 200
-        assert email in activities["Chess Club"]["participants"]
+        assert email in _participants("Chess Club")
         
         # Delete
-        delete_response = client.delete(
-            "/activities/Chess Club/signup",
+        delete_response = await client.delete(
+            CHESS_SIGNUP,
             params={"email": email}
         )
         assert delete_response.status_code == 200
-        assert email not in activities["Chess Club"]["participants"]
+        assert email not in _participants("Chess Club")
+
+
+class TestErrorPaths:
+    """Tests for signup and unregister error responses"""
+    
+    @pytest.mark.parametrize(
+        "method,url,params,expected_status,expected_detail",
+        [
+            ("POST", CHESS_SIGNUP, CHESS_MEMBER_PARAMS, 400, "already signed up"),
+            ("POST", NONEXISTENT_SIGNUP, UNKNOWN_STUDENT_PARAMS, 404, "not found"),
+            ("DELETE", CHESS_SIGNUP, NOT_SIGNED_UP_PARAMS, 400, "not signed up"),
+            ("DELETE", NONEXISTENT_SIGNUP, UNKNOWN_STUDENT_PARAMS, 404, "not found"),
+        ],
+        ids=[
+            "signup_duplicate",
+            "signup_nonexistent_activity",
+            "delete_nonexistent_student",
+            "delete_nonexistent_activity",
+        ],
+    )
+    async def test_error_paths(self, client, reset_activities, method, url, params,
+                               expected_status, expected_detail):
+        """Test that invalid signup and unregister requests return the expected error"""
+        response = await client.request(method, url, params=params)
+        
+        assert response.status_code == expected_status
+        assert expected_detail in response.json()["detail"]
 
 
 class TestRootEndpoint:
     """Tests for GET / endpoint"""
     
-    def test_root_redirects(self, client):
+    async def test_root_redirects(self, client):
         """Test that root endpoint redirects to static HTML"""
-        response = client.get("/", follow_redirects=False)
+        response = await client.get("/", follow_redirects=False)
         assert response.status_code == 307
         assert "/static/index.html" in response.headers["location"]